@@ -29,7 +29,7 @@ class KnowledgeBase(Base):
 class File(Base):
     __tablename__ = 'knowledge_base_files'
     uuid = sqlalchemy.Column(sqlalchemy.String(255), primary_key=True, unique=True)
-    kb_id = sqlalchemy.Column(sqlalchemy.String(255), nullable=True)
+    kb_id = sqlalchemy.Column(sqlalchemy.String(255), nullable=True, index=True)
     file_name = sqlalchemy.Column(sqlalchemy.String)
     extension = sqlalchemy.Column(sqlalchemy.String)
     created_at = sqlalchemy.Column(sqlalchemy.DateTime, default=sqlalchemy.func.now())
@@ -39,7 +39,8 @@ class File(Base):
 class Chunk(Base):
     __tablename__ = 'knowledge_base_chunks'
     uuid = sqlalchemy.Column(sqlalchemy.String(255), primary_key=True, unique=True)
-    file_id = sqlalchemy.Column(sqlalchemy.String(255), nullable=True)
+    # indexed for deleting / listing by file; costs a little on insert, chunks are written once per file
+    file_id = sqlalchemy.Column(sqlalchemy.String(255), nullable=True, index=True)
     text = sqlalchemy.Column(sqlalchemy.Text)
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sqlalchemy
 import sqlalchemy.ext.asyncio as sqlalchemy_asyncio
 
 from .. import database
@@ -11,4 +12,43 @@ class SQLiteDatabaseManager(database.BaseDatabaseManager):
 
     async def initialize(self) -> None:
         sqlite_path = 'data/langbot.db'
-        self.engine = sqlalchemy_asyncio.create_async_engine(f'sqlite+aiosqlite:///{sqlite_path}')
+        # keep a small set of long-lived connections so the pragmas and page cache survive between queries
+        self.engine = sqlalchemy_asyncio.create_async_engine(
+            f'sqlite+aiosqlite:///{sqlite_path}',
+            poolclass=sqlalchemy.pool.AsyncAdaptedQueuePool,
+            pool_size=5,
+            max_overflow=5,
+            # disable the driver's implicit BEGIN, transactions are started in _begin instead
+            connect_args={'isolation_level': None},
+        )
+
+        sqlalchemy.event.listen(self.engine.sync_engine, 'connect', self._set_pragmas)
+        sqlalchemy.event.listen(self.engine.sync_engine, 'begin', self._begin)
+
+    @staticmethod
+    def _set_pragmas(dbapi_connection, connection_record) -> None:
+        """Apply pragmas on every new connection
+
+        WAL lets readers and the writer run concurrently, and synchronous=NORMAL
+        only fsyncs at checkpoints instead of on every commit.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA cache_size=-65536')
+        cursor.close()
+
+    @staticmethod
+    def _begin(conn: sqlalchemy.Connection) -> None:
+        """Start a transaction
+
+        Reads use a deferred BEGIN so they never take the write lock. Connections marked with the
+        write_transaction execution option use BEGIN IMMEDIATE, which takes the write lock up front
+        and waits on the busy timeout, instead of upgrading a read lock mid-transaction and failing
+        with SQLITE_BUSY when another writer holds it.
+        """
+        if conn.get_execution_options().get('write_transaction', False):
+            conn.exec_driver_sql('BEGIN IMMEDIATE')
+        else:
+            conn.exec_driver_sql('BEGIN')
@@ -121,6 +121,10 @@ class PersistenceManager:
 
     async def execute_async(self, *args, **kwargs) -> sqlalchemy.engine.cursor.CursorResult:
         async with self.get_db_engine().connect() as conn:
+            if getattr(args[0] if args else kwargs.get('statement'), 'is_dml', False):
+                # lets the database manager start this transaction as a write transaction
+                await conn.execution_options(write_transaction=True)
+
             result = await conn.execute(*args, **kwargs)
             await conn.commit()
             return result
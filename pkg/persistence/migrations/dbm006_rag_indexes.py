@@ -0,0 +1,21 @@
+from .. import migration
+
+import sqlalchemy
+
+from ...entity.persistence import rag as persistence_rag
+
+
+@migration.migration_class(6)
+class DBMigrateRAGIndexes(migration.DBMigration):
+    """RAG file and chunk indexes"""
+
+    async def upgrade(self):
+        """Upgrade"""
+        # create_all does not add indexes to tables that already exist
+        for table in (persistence_rag.File.__table__, persistence_rag.Chunk.__table__):
+            for index in table.indexes:
+                await self.ap.persistence_mgr.execute_async(sqlalchemy.schema.CreateIndex(index, if_not_exists=True))
+
+    async def downgrade(self):
+        """Downgrade"""
+        pass
@@ -12,28 +12,26 @@ class BanSessionCheckStage(stage.PipelineStage):
     """
 
     async def initialize(self, pipeline_config: dict):
-        pass
+        access_control = pipeline_config['trigger']['access-control']
 
-    async def process(self, query: core_entities.Query, stage_inst_name: str) -> entities.StageProcessResult:
-        found = False
+        self.mode: str = access_control['mode']
 
-        mode = query.pipeline_config['trigger']['access-control']['mode']
+        # precompile the access control list into a set once, instead of scanning the list for every message
+        self.sess_set: frozenset[str] = frozenset(str(sess) for sess in access_control[self.mode])
 
-        sess_list = query.pipeline_config['trigger']['access-control'][mode]
+        # launcher types listed with a wildcard, e.g. 'group_*', so no wildcard string is built per message
+        self.wildcard_types: frozenset[str] = frozenset(
+            sess[: -len('_*')] for sess in self.sess_set if sess.endswith('_*')
+        )
 
-        if (query.launcher_type.value == 'group' and 'group_*' in sess_list) or (
-            query.launcher_type.value == 'person' and 'person_*' in sess_list
-        ):
-            found = True
-        else:
-            for sess in sess_list:
-                if sess == f'{query.launcher_type.value}_{query.launcher_id}':
-                    found = True
-                    break
+    async def process(self, query: core_entities.Query, stage_inst_name: str) -> entities.StageProcessResult:
+        launcher_type = query.launcher_type.value
+
+        found = launcher_type in self.wildcard_types or f'{launcher_type}_{query.launcher_id}' in self.sess_set
 
         ctn = False
 
-        if mode == 'whitelist':
+        if self.mode == 'whitelist':
             ctn = found
         else:
             ctn = not found
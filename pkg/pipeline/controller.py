@@ -30,7 +30,7 @@ class Controller:
 
                     for query in queries:
                         session = await self.ap.sess_mgr.get_session(query)
-                        self.ap.logger.debug(f'Checking query {query} session {session}')
+                        self.ap.logger.debug('Checking query %s session %s', query, session)
 
                         if not session.semaphore.locked():
                             selected_query = query
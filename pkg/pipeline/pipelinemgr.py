@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import typing
-import traceback
 
 import sqlalchemy
 
@@ -153,26 +152,29 @@ class RuntimePipeline:
 
             if isinstance(result, pipeline_entities.StageProcessResult):  # 直接返回结果
                 self.ap.logger.debug(
-                    f'Stage {stage_container.inst_name} processed query {query.query_id} res {result.result_type}'
+                    'Stage %s processed query %s res %s', stage_container.inst_name, query.query_id, result.result_type
                 )
                 await self._check_output(query, result)
 
                 if result.result_type == pipeline_entities.ResultType.INTERRUPT:
-                    self.ap.logger.debug(f'Stage {stage_container.inst_name} interrupted query {query.query_id}')
+                    self.ap.logger.debug('Stage %s interrupted query %s', stage_container.inst_name, query.query_id)
                     break
                 elif result.result_type == pipeline_entities.ResultType.CONTINUE:
                     query = result.new_query
             elif isinstance(result, typing.AsyncGenerator):  # 生成器
-                self.ap.logger.debug(f'Stage {stage_container.inst_name} processed query {query.query_id} gen')
+                self.ap.logger.debug('Stage %s processed query %s gen', stage_container.inst_name, query.query_id)
 
                 async for sub_result in result:
                     self.ap.logger.debug(
-                        f'Stage {stage_container.inst_name} processed query {query.query_id} res {sub_result.result_type}'
+                        'Stage %s processed query %s res %s',
+                        stage_container.inst_name,
+                        query.query_id,
+                        sub_result.result_type,
                     )
                     await self._check_output(query, sub_result)
 
                     if sub_result.result_type == pipeline_entities.ResultType.INTERRUPT:
-                        self.ap.logger.debug(f'Stage {stage_container.inst_name} interrupted query {query.query_id}')
+                        self.ap.logger.debug('Stage %s interrupted query %s', stage_container.inst_name, query.query_id)
                         break
                     elif sub_result.result_type == pipeline_entities.ResultType.CONTINUE:
                         query = sub_result.new_query
@@ -204,15 +206,14 @@ class RuntimePipeline:
             if event_ctx.is_prevented_default():
                 return
 
-            self.ap.logger.debug(f'Processing query {query.query_id}')
+            self.ap.logger.debug('Processing query %s', query.query_id)
 
             await self._execute_from_stage(0, query)
         except Exception as e:
             inst_name = query.current_stage.inst_name if query.current_stage else 'unknown'
-            self.ap.logger.error(f'处理请求时出错 query_id={query.query_id} stage={inst_name} : {e}')
-            self.ap.logger.error(f'Traceback: {traceback.format_exc()}')
+            self.ap.logger.exception('处理请求时出错 query_id=%s stage=%s : %s', query.query_id, inst_name, e)
         finally:
-            self.ap.logger.debug(f'Query {query.query_id} processed')
+            self.ap.logger.debug('Query %s processed', query.query_id)
 
 
 class PipelineManager:
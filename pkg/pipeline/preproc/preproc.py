@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import datetime
+import time
 
 from .. import stage, entities
 from ...core import entities as core_entities
@@ -63,12 +63,12 @@ class PreProcessor(stage.PipelineStage):
                 conversation.use_funcs if query.use_llm_model.model_entity.abilities.__contains__('func_call') else None
             )
 
+        session_id = f'{query.session.launcher_type.value}_{query.session.launcher_id}'
+
         query.variables = {
-            'session_id': f'{query.session.launcher_type.value}_{query.session.launcher_id}',
+            'session_id': session_id,
             'conversation_id': conversation.uuid,
-            'msg_create_time': (
-                int(query.message_event.time) if query.message_event.time else int(datetime.datetime.now().timestamp())
-            ),
+            'msg_create_time': int(query.message_event.time) if query.message_event.time else int(time.time()),
         }
 
         # Check if this model supports vision, if not, remove all images
@@ -82,30 +82,31 @@ class PreProcessor(stage.PipelineStage):
 
         content_list: list[llm_entities.ContentElement] = []
 
-        plain_text = ''
+        plain_text_parts: list[str] = []
         qoute_msg = query.pipeline_config['trigger'].get('misc', '').get('combine-quote-message')
 
+        # whether images in the message chain should be passed on, checked once instead of per component
+        keep_images = selected_runner != 'local-agent' or query.use_llm_model.model_entity.abilities.__contains__(
+            'vision'
+        )
+
         # tidy the content_list
         # combine all text content into one, and put it in the first position
         for me in query.message_chain:
             if isinstance(me, platform_message.Plain):
-                plain_text += me.text
+                plain_text_parts.append(me.text)
             elif isinstance(me, platform_message.Image):
-                if selected_runner != 'local-agent' or query.use_llm_model.model_entity.abilities.__contains__(
-                    'vision'
-                ):
-                    if me.base64 is not None:
-                        content_list.append(llm_entities.ContentElement.from_image_base64(me.base64))
+                if keep_images and me.base64 is not None:
+                    content_list.append(llm_entities.ContentElement.from_image_base64(me.base64))
             elif isinstance(me, platform_message.Quote) and qoute_msg:
                 for msg in me.origin:
                     if isinstance(msg, platform_message.Plain):
                         content_list.append(llm_entities.ContentElement.from_text(msg.text))
                     elif isinstance(msg, platform_message.Image):
-                        if selected_runner != 'local-agent' or query.use_llm_model.model_entity.abilities.__contains__(
-                            'vision'
-                        ):
-                            if msg.base64 is not None:
-                                content_list.append(llm_entities.ContentElement.from_image_base64(msg.base64))
+                        if keep_images and msg.base64 is not None:
+                            content_list.append(llm_entities.ContentElement.from_image_base64(msg.base64))
+
+        plain_text = ''.join(plain_text_parts)
 
         content_list.insert(0, llm_entities.ContentElement.from_text(plain_text))
 
@@ -116,7 +117,7 @@ class PreProcessor(stage.PipelineStage):
 
         event_ctx = await self.ap.plugin_mgr.emit_event(
             event=events.PromptPreProcessing(
-                session_name=f'{query.session.launcher_type.value}_{query.session.launcher_id}',
+                session_name=session_id,
                 default_prompt=query.prompt.messages,
                 prompt=query.messages,
                 query=query,
@@ -44,8 +44,10 @@ class GroupRespondRuleCheckStage(stage.PipelineStage):
         # if str(query.launcher_id) in rules:
         #     use_rule = rules[str(query.launcher_id)]
 
+        message_text = str(query.message_chain)
+
         for rule_matcher in self.rule_matchers:  # 任意一个匹配就放行
-            res = await rule_matcher.match(str(query.message_chain), query.message_chain, use_rule, query)
+            res = await rule_matcher.match(message_text, query.message_chain, use_rule, query)
             if res.matching:
                 query.message_chain = res.replacement
 
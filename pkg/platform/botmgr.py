@@ -61,52 +61,62 @@ class RuntimeBot:
             event: platform_events.FriendMessage,
             adapter: msadapter.MessagePlatformAdapter,
         ):
+            message_chain = event.message_chain
+
             image_components = [
-                component for component in event.message_chain if isinstance(component, platform_message.Image)
+                component for component in message_chain if isinstance(component, platform_message.Image)
             ]
 
-            await self.logger.info(
-                f'{event.message_chain}',
-                images=image_components,
-                message_session_id=f'person_{event.sender.id}',
-            )
+            message_text = str(message_chain)
 
+            # enqueue first, saving the logged images to storage should not delay the pipeline
             await self.ap.query_pool.add_query(
                 bot_uuid=self.bot_entity.uuid,
                 launcher_type=core_entities.LauncherTypes.PERSON,
                 launcher_id=event.sender.id,
                 sender_id=event.sender.id,
                 message_event=event,
-                message_chain=event.message_chain,
+                message_chain=message_chain,
                 adapter=adapter,
                 pipeline_uuid=self.bot_entity.use_pipeline_uuid,
             )
 
+            await self.logger.info(
+                message_text,
+                images=image_components,
+                message_session_id=f'person_{event.sender.id}',
+            )
+
         async def on_group_message(
             event: platform_events.GroupMessage,
             adapter: msadapter.MessagePlatformAdapter,
         ):
+            message_chain = event.message_chain
+
             image_components = [
-                component for component in event.message_chain if isinstance(component, platform_message.Image)
+                component for component in message_chain if isinstance(component, platform_message.Image)
             ]
 
-            await self.logger.info(
-                f'{event.message_chain}',
-                images=image_components,
-                message_session_id=f'group_{event.group.id}',
-            )
+            message_text = str(message_chain)
 
+            # enqueue first, saving the logged images to storage should not delay the pipeline
             await self.ap.query_pool.add_query(
                 bot_uuid=self.bot_entity.uuid,
                 launcher_type=core_entities.LauncherTypes.GROUP,
                 launcher_id=event.group.id,
                 sender_id=event.sender.id,
                 message_event=event,
-                message_chain=event.message_chain,
+                message_chain=message_chain,
                 adapter=adapter,
                 pipeline_uuid=self.bot_entity.use_pipeline_uuid,
             )
 
+            await self.logger.info(
+                message_text,
+                images=image_components,
+                message_session_id=f'group_{event.group.id}',
+            )
+
         self.adapter.register_listener(platform_events.FriendMessage, on_friend_message)
         self.adapter.register_listener(platform_events.GroupMessage, on_group_message)
 
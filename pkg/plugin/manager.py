@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import traceback
-
 import sqlalchemy
 
 from ..core import app, taskmgr
@@ -84,33 +82,39 @@ class PluginManager:
         self.ap.logger.debug(f'优先级排序后的插件列表 {self.plugin_containers}')
 
     async def load_plugin_settings(self, plugin_containers: list[context.RuntimeContainer]):
-        for plugin_container in plugin_containers:
-            result = await self.ap.persistence_mgr.execute_async(
-                sqlalchemy.select(persistence_plugin.PluginSetting)
-                .where(persistence_plugin.PluginSetting.plugin_author == plugin_container.plugin_author)
-                .where(persistence_plugin.PluginSetting.plugin_name == plugin_container.plugin_name)
-            )
+        # 一次性读出全部设置，避免每个插件各开一个事务
+        result = await self.ap.persistence_mgr.execute_async(sqlalchemy.select(persistence_plugin.PluginSetting))
 
-            setting = result.first()
+        settings = {(setting.plugin_author, setting.plugin_name): setting for setting in result.all()}
+
+        new_settings_data: dict[tuple[str, str], dict] = {}
+
+        for plugin_container in plugin_containers:
+            key = (plugin_container.plugin_author, plugin_container.plugin_name)
+            setting = settings.get(key)
 
             if setting is None:
-                new_setting_data = {
-                    'plugin_author': plugin_container.plugin_author,
-                    'plugin_name': plugin_container.plugin_name,
-                    'enabled': plugin_container.enabled,
-                    'priority': plugin_container.priority,
-                    'config': plugin_container.plugin_config,
-                }
-
-                await self.ap.persistence_mgr.execute_async(
-                    sqlalchemy.insert(persistence_plugin.PluginSetting).values(**new_setting_data)
+                new_settings_data.setdefault(
+                    key,
+                    {
+                        'plugin_author': plugin_container.plugin_author,
+                        'plugin_name': plugin_container.plugin_name,
+                        'enabled': plugin_container.enabled,
+                        'priority': plugin_container.priority,
+                        'config': plugin_container.plugin_config,
+                    },
                 )
-                continue
             else:
                 plugin_container.enabled = setting.enabled
                 plugin_container.priority = setting.priority
                 plugin_container.plugin_config = setting.config
 
+        if new_settings_data:
+            # 新插件的设置在同一个事务中批量写入
+            await self.ap.persistence_mgr.execute_async(
+                sqlalchemy.insert(persistence_plugin.PluginSetting), list(new_settings_data.values())
+            )
+
     async def dump_plugin_container_setting(self, plugin_container: context.RuntimeContainer):
         """保存单个插件容器的设置到数据库"""
         await self.ap.persistence_mgr.execute_async(
@@ -231,7 +235,7 @@ class PluginManager:
 
         for plugin in self.plugins(enabled=True, status=context.RuntimeContainerStatus.INITIALIZED):
             if event.__class__ in plugin.event_handlers:
-                self.ap.logger.debug(f'插件 {plugin.plugin_name} 处理事件 {event.__class__.__name__}')
+                self.ap.logger.debug('插件 %s 处理事件 %s', plugin.plugin_name, event.__class__.__name__)
 
                 is_prevented_default_before_call = ctx.is_prevented_default()
 
@@ -241,22 +245,23 @@ class PluginManager:
                     self.ap.logger.error(
                         f'插件 {plugin.plugin_name} 处理事件 {event.__class__.__name__} 时发生错误: {e}'
                     )
-                    self.ap.logger.debug(f'Traceback: {traceback.format_exc()}')
+                    # exc_info is only formatted when debug logging is enabled
+                    self.ap.logger.debug('Traceback:', exc_info=True)
 
                 emitted_plugins.append(plugin)
 
                 if not is_prevented_default_before_call and ctx.is_prevented_default():
-                    self.ap.logger.debug(f'插件 {plugin.plugin_name} 阻止了默认行为执行')
+                    self.ap.logger.debug('插件 %s 阻止了默认行为执行', plugin.plugin_name)
 
                 if ctx.is_prevented_postorder():
-                    self.ap.logger.debug(f'插件 {plugin.plugin_name} 阻止了后序插件的执行')
+                    self.ap.logger.debug('插件 %s 阻止了后序插件的执行', plugin.plugin_name)
                     break
 
         for key in ctx.__return_value__.keys():
             if hasattr(ctx.event, key):
                 setattr(ctx.event, key, ctx.__return_value__[key][0])
 
-        self.ap.logger.debug(f'事件 {event.__class__.__name__}({ctx.eid}) 处理完成，返回值 {ctx.__return_value__}')
+        self.ap.logger.debug('事件 %s(%s) 处理完成，返回值 %s', event.__class__.__name__, ctx.eid, ctx.__return_value__)
 
         # TODO statistics
 
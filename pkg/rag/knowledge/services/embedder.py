@@ -15,22 +15,18 @@ class Embedder(BaseService):
 
     async def embed_and_store(
         self, kb_id: str, file_id: str, chunks: List[str], embedding_model: RuntimeEmbeddingModel
-    ) -> list[persistence_rag.Chunk]:
-        # save chunk to db
-        chunk_entities: list[persistence_rag.Chunk] = []
-        chunk_ids: list[str] = []
-
-        for chunk_text in chunks:
-            chunk_uuid = str(uuid.uuid4())
-            chunk_ids.append(chunk_uuid)
-            chunk_entity = persistence_rag.Chunk(uuid=chunk_uuid, file_id=file_id, text=chunk_text)
-            chunk_entities.append(chunk_entity)
+    ) -> list[dict]:
+        # save chunk to db, as plain rows so no ORM instances are built just to be serialized again
+        chunk_ids: list[str] = [str(uuid.uuid4()) for _ in chunks]
 
         chunk_dicts = [
-            self.ap.persistence_mgr.serialize_model(persistence_rag.Chunk, chunk) for chunk in chunk_entities
+            {'uuid': chunk_uuid, 'file_id': file_id, 'text': chunk_text}
+            for chunk_uuid, chunk_text in zip(chunk_ids, chunks)
         ]
 
-        await self.ap.persistence_mgr.execute_async(sqlalchemy.insert(persistence_rag.Chunk).values(chunk_dicts))
+        # executemany instead of a single multi-VALUES statement, which also keeps large files under
+        # SQLite's bound parameter limit
+        await self.ap.persistence_mgr.execute_async(sqlalchemy.insert(persistence_rag.Chunk), chunk_dicts)
 
         # get embeddings
         embeddings_list: list[list[float]] = await embedding_model.requester.invoke_embedding(
@@ -42,6 +38,6 @@ class Embedder(BaseService):
         # save embeddings to vdb
         await self.ap.vector_db_mgr.vector_db.add_embeddings(kb_id, chunk_ids, embeddings_list, chunk_dicts)
 
-        self.ap.logger.info(f'Successfully saved {len(chunk_entities)} embeddings to Knowledge Base.')
+        self.ap.logger.info(f'Successfully saved {len(chunk_dicts)} embeddings to Knowledge Base.')
 
-        return chunk_entities
+        return chunk_dicts
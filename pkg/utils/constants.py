@@ -1,6 +1,6 @@
 semantic_version = 'v4.2.1'
 
-required_database_version = 5
+required_database_version = 6
 """Tag the version of the database schema, used to check if the database needs to be migrated"""
 
 debug_mode = False